@@ -6,70 +6,105 @@ This script generates synthetic exam questions in PDF format and places them
 in the input/ folder, so you can test the system without needing real exam papers.
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+except ImportError:
+    SimpleDocTemplate = None
+else:
+    # Styles are built once and shared across PDFs; Paragraphs hold layout
+    # state, so those are still created per document
+    _STYLES = getSampleStyleSheet()
+    _TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=16,
+        textColor='navy',
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    _QUESTION_STYLE = ParagraphStyle(
+        'Question',
+        parent=_STYLES['BodyText'],
+        fontSize=11,
+        spaceAfter=12,
+        leftIndent=20
+    )
+
 # Import path utilities
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 from profiler_agent.paths import get_input_path, ensure_directories
 
 
-SAMPLE_EXAMS = {
-    "physics_2024_midterm.pdf": {
-        "title": "Physics 101 - Midterm Examination 2024",
-        "questions": [
-            ("1. Define Newton's first law of motion and provide an example.", "Remember"),
-            ("2. A 5kg object accelerates at 2m/s². Calculate the net force acting on it.", "Apply"),
-            ("3. Compare and contrast potential energy and kinetic energy.", "Understand"),
-            ("4. Analyze the motion of a pendulum and explain energy transformations.", "Analyze"),
-            ("5. Design an experiment to measure the acceleration due to gravity.", "Create"),
-            ("6. A car moves at constant velocity. What can you infer about the forces?", "Understand"),
-            ("7. Evaluate the efficiency of different types of engines.", "Evaluate"),
-            ("8. State the formula for gravitational force.", "Remember"),
-            ("9. Apply conservation of momentum to a collision between two objects.", "Apply"),
-            ("10. Explain why astronauts feel weightless in orbit.", "Understand"),
-        ]
-    },
-    "physics_2023_final.pdf": {
-        "title": "Physics 101 - Final Examination 2023",
-        "questions": [
-            ("1. List the three laws of thermodynamics.", "Remember"),
-            ("2. Calculate the work done by a force of 10N moving an object 5m.", "Apply"),
-            ("3. Explain the relationship between temperature and kinetic energy.", "Understand"),
-            ("4. Analyze heat transfer in a closed system.", "Analyze"),
-            ("5. Evaluate the environmental impact of different energy sources.", "Evaluate"),
-            ("6. Design a solar heating system for a house.", "Create"),
-            ("7. Define entropy in your own words.", "Understand"),
-            ("8. What is the first law of thermodynamics?", "Remember"),
-            ("9. Apply the ideal gas law to calculate pressure at different temperatures.", "Apply"),
-            ("10. Compare conduction, convection, and radiation.", "Understand"),
-        ]
-    },
-    "chemistry_2024_q1.pdf": {
-        "title": "Chemistry 201 - First Quarter Exam 2024",
-        "questions": [
-            ("1. Write the electron configuration for oxygen.", "Remember"),
-            ("2. Balance this equation: H₂ + O₂ → H₂O", "Apply"),
-            ("3. Explain why noble gases are chemically inert.", "Understand"),
-            ("4. Analyze the bonding in a water molecule.", "Analyze"),
-            ("5. Evaluate the safety of different laboratory procedures.", "Evaluate"),
-            ("6. Design a procedure to synthesize aspirin.", "Create"),
-            ("7. Define electronegativity.", "Remember"),
-            ("8. Calculate the molar mass of glucose (C₆H₁₂O₆).", "Apply"),
-            ("9. Compare ionic and covalent bonding.", "Understand"),
-            ("10. Analyze the pH of different household substances.", "Analyze"),
-        ]
-    },
-}
-
-
-def create_sample_pdf(filename: str, exam_data: dict):
+# Sample exams stored column-wise: index i of each list describes exam i.
+# Bloom levels are not rendered into the PDFs and are kept for reference.
+EXAM_FILENAMES = [
+    "physics_2024_midterm.pdf",
+    "physics_2023_final.pdf",
+    "chemistry_2024_q1.pdf",
+]
+
+EXAM_TITLES = [
+    "Physics 101 - Midterm Examination 2024",
+    "Physics 101 - Final Examination 2023",
+    "Chemistry 201 - First Quarter Exam 2024",
+]
+
+EXAM_QUESTIONS = [
+    [
+        "1. Define Newton's first law of motion and provide an example.",
+        "2. A 5kg object accelerates at 2m/s². Calculate the net force acting on it.",
+        "3. Compare and contrast potential energy and kinetic energy.",
+        "4. Analyze the motion of a pendulum and explain energy transformations.",
+        "5. Design an experiment to measure the acceleration due to gravity.",
+        "6. A car moves at constant velocity. What can you infer about the forces?",
+        "7. Evaluate the efficiency of different types of engines.",
+        "8. State the formula for gravitational force.",
+        "9. Apply conservation of momentum to a collision between two objects.",
+        "10. Explain why astronauts feel weightless in orbit.",
+    ],
+    [
+        "1. List the three laws of thermodynamics.",
+        "2. Calculate the work done by a force of 10N moving an object 5m.",
+        "3. Explain the relationship between temperature and kinetic energy.",
+        "4. Analyze heat transfer in a closed system.",
+        "5. Evaluate the environmental impact of different energy sources.",
+        "6. Design a solar heating system for a house.",
+        "7. Define entropy in your own words.",
+        "8. What is the first law of thermodynamics?",
+        "9. Apply the ideal gas law to calculate pressure at different temperatures.",
+        "10. Compare conduction, convection, and radiation.",
+    ],
+    [
+        "1. Write the electron configuration for oxygen.",
+        "2. Balance this equation: H₂ + O₂ → H₂O",
+        "3. Explain why noble gases are chemically inert.",
+        "4. Analyze the bonding in a water molecule.",
+        "5. Evaluate the safety of different laboratory procedures.",
+        "6. Design a procedure to synthesize aspirin.",
+        "7. Define electronegativity.",
+        "8. Calculate the molar mass of glucose (C₆H₁₂O₆).",
+        "9. Compare ionic and covalent bonding.",
+        "10. Analyze the pH of different household substances.",
+    ],
+]
+
+EXAM_BLOOM_LEVELS = [
+    ["Remember", "Apply", "Understand", "Analyze", "Create", "Understand", "Evaluate", "Remember", "Apply", "Understand"],
+    ["Remember", "Apply", "Understand", "Analyze", "Evaluate", "Create", "Understand", "Remember", "Apply", "Understand"],
+    ["Remember", "Apply", "Understand", "Analyze", "Evaluate", "Create", "Remember", "Apply", "Understand", "Analyze"],
+]
+
+
+def create_sample_pdf(filename: str, title: str, questions: list):
     """Create a sample exam PDF with the given questions."""
     filepath = str(get_input_path(filename))  # Convert Path to string
     
@@ -86,51 +121,29 @@ def create_sample_pdf(filename: str, exam_data: dict):
     # Container for the 'Flowable' objects
     elements = []
     
-    # Define styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor='navy',
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    question_style = ParagraphStyle(
-        'Question',
-        parent=styles['BodyText'],
-        fontSize=11,
-        spaceAfter=12,
-        leftIndent=20
-    )
-    
     # Add title
-    title = Paragraph(exam_data["title"], title_style)
-    elements.append(title)
+    elements.append(Paragraph(title, _TITLE_STYLE))
     elements.append(Spacer(1, 0.2*inch))
     
     # Add instructions
     instructions = Paragraph(
         "<b>Instructions:</b> Answer all questions. Show all work for calculation problems. "
         "Total time: 90 minutes. Good luck!",
-        styles['Normal']
+        _STYLES['Normal']
     )
     elements.append(instructions)
     elements.append(Spacer(1, 0.3*inch))
     
-    # Add questions
-    for question_text, bloom_level in exam_data["questions"]:
-        question = Paragraph(question_text, question_style)
-        elements.append(question)
-        elements.append(Spacer(1, 0.15*inch))
+    # Add questions as one paragraph so layout runs once rather than per question
+    question_block = "<br/><br/>".join(questions)
+    elements.append(Paragraph(question_block, _QUESTION_STYLE))
     
     # Add footer
     elements.append(Spacer(1, 0.5*inch))
     footer = Paragraph(
         f"<i>This is a sample exam generated for testing purposes. "
         f"Bloom's levels included for demonstration.</i>",
-        styles['Italic']
+        _STYLES['Italic']
     )
     elements.append(footer)
     
@@ -139,6 +152,15 @@ def create_sample_pdf(filename: str, exam_data: dict):
     print(f"✓ Created {filename}")
 
 
+def _render_one(item):
+    """Render a single (filename, title, questions) row; runs in a worker process."""
+    filename, title, questions = item
+    try:
+        create_sample_pdf(filename, title, questions)
+    except Exception as e:
+        print(f"✗ Failed to create {filename}: {e}")
+
+
 def main():
     """Generate all sample exam PDFs."""
     print("Generating sample exam PDFs...\n")
@@ -147,21 +169,17 @@ def main():
     ensure_directories()
     
     # Check if reportlab is available
-    try:
-        import reportlab
-    except ImportError:
+    if SimpleDocTemplate is None:
         print("ERROR: reportlab is required to generate sample PDFs")
         print("Install it with: pip install reportlab")
         return 1
     
-    # Generate each exam
-    for filename, exam_data in SAMPLE_EXAMS.items():
-        try:
-            create_sample_pdf(filename, exam_data)
-        except Exception as e:
-            print(f"✗ Failed to create {filename}: {e}")
+    # Generate each exam in its own process (layout and compression are CPU-bound)
+    max_workers = min(len(EXAM_FILENAMES), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_render_one, zip(EXAM_FILENAMES, EXAM_TITLES, EXAM_QUESTIONS)))
     
-    print(f"\n✓ Successfully generated {len(SAMPLE_EXAMS)} sample exam PDFs")
+    print(f"\n✓ Successfully generated {len(EXAM_FILENAMES)} sample exam PDFs")
     print(f"✓ Files saved to: {get_input_path('')}")
     print("\nYou can now run: python demo.py")
     return 0
@@ -1 +1,2 @@
 from .agent import Agent
+from .response_cache import ResponseCache
@@ -7,9 +7,36 @@ This module defines a reusable Agent class that:
 - Provides lifecycle hooks for post-processing
 """
 import asyncio
+import datetime
 import json
 from typing import List, Dict, Any, Optional, Callable
 from google.genai import types as genai_types
+from .response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON encoding for tool results, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _build_user_content(prompt: str) -> genai_types.Content:
+    """Build the user Content payload for a prompt.
+
+    Sub-agents sharing a parent response send identical prompts, so
+    `_execute_sub_agents` builds their payload once and shares it; it
+    is never mutated after creation.
+    """
+    return genai_types.Content(
+        role="user",
+        parts=[genai_types.Part.from_text(text=prompt)]
+    )
 
 
 class Agent:
@@ -32,6 +59,8 @@ class Agent:
         sub_agents: Optional[List['Agent']] = None,
         output_key: Optional[str] = None,
         after_agent_callback: Optional[Callable] = None,
+        parallel: bool = False,
+        response_cache: Optional[ResponseCache] = None,
         **kwargs
     ):
         # Agent identity and model configuration
@@ -46,16 +75,59 @@ class Agent:
         self.tools = tools or []
         self.sub_agents = sub_agents or []
         
+        # Run sub-agents concurrently instead of one after another
+        self.parallel = parallel
+        
+        # Leaf agents skip the delegation and callback stages in run()
+        self._is_leaf = not self.sub_agents and not after_agent_callback
+        
         # Output routing / post-processing metadata
         self.output_key = output_key
         self.after_agent_callback = after_agent_callback
         
+        # Cache for text responses; sub-agents inherit it on initialize().
+        # Pass cache=False to opt a non-deterministic agent out.
+        self.response_cache = response_cache
+        
         # Model generation parameters (temperature, top_p, etc.)
         self.kwargs = kwargs
+        self._base_config_kwargs = {
+            "temperature": kwargs.get("temperature", 0.7),
+            "top_p": kwargs.get("top_p", 0.95),
+            "top_k": kwargs.get("top_k", 40),
+            "max_output_tokens": kwargs.get("max_output_tokens", 2048),
+        }
+        
+        # Validated once; each request takes an unvalidated copy of it
+        self._config_template = genai_types.GenerateContentConfig(**self._base_config_kwargs)
         
         # Runtime state (initialized later)
         self.client = None
         self.context = {}
+        self._context_blob = ""
+        
+        # Tool dispatch table and declarations, keyed/serialized once
+        self._tool_by_name = {t.name: t for t in self.tools if hasattr(t, 'name')}
+        self._tool_declarations = [
+            t.to_gemini_declaration() for t in self.tools
+            if hasattr(t, 'to_gemini_declaration')
+        ]
+        
+        # Role, instructions, tools and sub-agents are fixed after construction,
+        # so the per-request system instruction and tool config are built once
+        self._system_instruction_cached = self._build_system_instruction()
+        self._tool_config_cached = self._prepare_tool_config()
+        
+        # A "{now}" placeholder is filled with the request date at run time;
+        # split once here so each run is a single join
+        self._system_instruction_parts = self._system_instruction_cached.split("{now}")
+        
+        # Request settings other than instruction and prompt, for cache keys
+        self._cache_signature = json.dumps(
+            [self._base_config_kwargs, self._tool_config_cached],
+            sort_keys=True,
+            default=str
+        )
         
     def __repr__(self):
         """Readable representation for debugging and logs."""
@@ -69,12 +141,16 @@ class Agent:
         """
         self.client = client
         for sub_agent in self.sub_agents:
+            if sub_agent.response_cache is None:
+                sub_agent.response_cache = self.response_cache
             await sub_agent.initialize(client)
         
     async def run(
         self,
         prompt: str,
         context: Optional[Dict[str, Any]] = None,
+        context_blob: Optional[str] = None,
+        user_content: Optional[genai_types.Content] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Execute the agent on a given prompt and optional shared context.
@@ -85,31 +161,45 @@ class Agent:
         - LLM execution
         - Sub-agent delegation
         - Post-execution callbacks
+
+        `context_blob`, when given, must be the serialized form of
+        `context` (see `_serialize_context`) and is used as-is.
+        `user_content`, when given, must be the payload for the full
+        prompt (prompt plus context blob) and is sent as-is.
         """
         if not self.client:
             raise RuntimeError(f"Agent {self.name} not initialized with client")
         
-        # Store execution-scoped context
+        # Store execution-scoped context, serialized once and shared with sub-agents
         self.context = context or {}
+        if context_blob is None:
+            context_blob = self._serialize_context()
+        self._context_blob = context_blob
         
-        # Construct system-level instructions (role, constraints, metadata)
-        system_instruction = self._build_system_instruction()
-        
-        # Combine user prompt with structured context
-        full_prompt = self._build_full_prompt(prompt)
+        # System-level instructions (role, constraints, metadata)
+        system_instruction = self._resolve_system_instruction()
         
-        # Prepare Gemini-compatible tool declarations
-        tool_config = self._prepare_tool_config()
+        # Gemini-compatible tool declarations
+        tool_config = self._tool_config_cached
         
         try:
             # Execute the primary LLM call
-            response = await self._execute_llm(
-                full_prompt,
+            response = await self._generate_response(
+                prompt,
+                context_blob,
                 system_instruction,
-                tool_config
+                tool_config,
+                user_content
             )
             
-            # Sequentially run sub-agents on the parent response
+            if self._is_leaf:
+                return {
+                    "agent": self.name,
+                    "response": response,
+                    "output_key": self.output_key
+                }
+            
+            # Run sub-agents on the parent response
             if self.sub_agents:
                 response = await self._execute_sub_agents(response)
             
@@ -163,48 +253,72 @@ class Agent:
         
         return "\n\n".join(parts)
     
-    def _build_full_prompt(self, prompt: str) -> str:
-        """Merge the user prompt with structured execution context.
+    def _resolve_system_instruction(self) -> str:
+        """Return the cached system instruction with "{now}" filled in."""
+        if len(self._system_instruction_parts) == 1:
+            return self._system_instruction_cached
+        
+        now = datetime.datetime.now().strftime('%Y-%m-%d')
+        return now.join(self._system_instruction_parts)
+    
+    def _serialize_context(self) -> str:
+        """Serialize the execution context as a prompt suffix.
 
-        Context is serialized in a readable, model-friendly format.
+        Context is rendered in a readable, model-friendly format
+        with a single JSON encoder pass; empty context yields "".
         """
         if not self.context:
-            return prompt
+            return ""
         
-        context_str = "\n\nContext:\n"
-        for key, value in self.context.items():
-            if isinstance(value, (dict, list)):
-                context_str += f"- {key}: {json.dumps(value, indent=2)}\n"
-            else:
-                context_str += f"- {key}: {value}\n"
+        return f"\n\nContext:\n{json.dumps(self.context, indent=2, default=str)}"
+    
+    async def _generate_response(
+        self,
+        prompt: str,
+        context_blob: str,
+        system_instruction: str,
+        tool_config: Optional[Dict[str, Any]],
+        user_content: Optional[genai_types.Content] = None
+    ) -> str:
+        """Produce the agent's own response, before any sub-agents run.
+
+        Combines the prompt with the context blob and calls the model.
+        Subclasses that preprocess the prompt override this, so they get
+        the prompt and context separately.
+        """
+        full_prompt = self._build_full_prompt(prompt, context_blob)
+        return await self._execute_llm(
+            full_prompt,
+            system_instruction,
+            tool_config,
+            user_content
+        )
+    
+    def _build_full_prompt(self, prompt: str, context_blob: Optional[str] = None) -> str:
+        """Merge the user prompt with structured execution context."""
+        if context_blob is None:
+            context_blob = self._serialize_context()
         
-        return prompt + context_str
+        return prompt + context_blob
     
     def _prepare_tool_config(self) -> Optional[Dict[str, Any]]:
         """Convert registered tools into Gemini function declarations.
 
         Returns None if no valid tools are available.
         """
-        if not self.tools:
-            return None
-        
-        tool_declarations = []
-        for tool in self.tools:
-            if hasattr(tool, 'to_gemini_declaration'):
-                tool_declarations.append(tool.to_gemini_declaration())
-        
-        if not tool_declarations:
+        if not self._tool_declarations:
             return None
         
         return {
-            "function_declarations": tool_declarations
+            "function_declarations": self._tool_declarations
         }
     
     async def _execute_llm(
         self,
         prompt: str,
         system_instruction: str,
-        tool_config: Optional[Dict[str, Any]]
+        tool_config: Optional[Dict[str, Any]],
+        user_content: Optional[genai_types.Content] = None
     ) -> str:
         """Execute a Gemini model call with optional tool support.
 
@@ -212,54 +326,52 @@ class Agent:
         - Generation configuration
         - Tool-aware requests
         - Tool call detection and execution
+        - Response caching (text responses only; tool calls always run)
         """
-        from google import genai
-        
-        # Model generation parameters
-        config = {
-            "temperature": self.kwargs.get("temperature", 0.7),
-            "top_p": self.kwargs.get("top_p", 0.95),
-            "top_k": self.kwargs.get("top_k", 40),
-            "max_output_tokens": self.kwargs.get("max_output_tokens", 2048),
-        }
-        
-        # User content payload
-        contents = [
-            genai_types.Content(
-                role="user",
-                parts=[genai_types.Part.from_text(text=prompt)]
+        # Serve repeated requests from the response cache
+        cache_key = None
+        if self.response_cache is not None and self.kwargs.get("cache", True):
+            cache_key = ResponseCache.make_key(
+                self.model, system_instruction, prompt, self._cache_signature
             )
-        ]
-        
-        # Request configuration
-        generate_kwargs = {
-            "model": self.model,
-            "contents": contents,
-            "config": genai_types.GenerateContentConfig(**config)
-        }
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        if system_instruction:
-            generate_kwargs["config"].system_instruction = system_instruction
+        # User content payload, unless the caller built it already
+        contents = [user_content or _build_user_content(prompt)]
         
+        # Request configuration, copied from the template without re-running
+        # validation (tool declarations are passed through as-is)
+        config_update = {"system_instruction": system_instruction or None}
         if tool_config:
-            generate_kwargs["config"].tools = [tool_config]
+            config_update["tools"] = [tool_config]
+        config = self._config_template.model_copy(update=config_update)
         
         # Invoke Gemini
-        response = await self.client.aio.models.generate_content(**generate_kwargs)
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=config
+        )
         
         # Inspect model output for tool calls or text responses
-        if hasattr(response, 'candidates') and response.candidates:
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'content') and candidate.content.parts:
-                for part in candidate.content.parts:
-                    if hasattr(part, 'function_call') and part.function_call:
-                        # Execute the requested tool
-                        return await self._execute_tool_call(part.function_call)
-                
-                # Default to returning textual output
-                return candidate.content.parts[0].text
-        
-        return str(response.text) if hasattr(response, 'text') else ""
+        candidate = response.candidates[0] if getattr(response, 'candidates', None) else None
+        if candidate is not None and hasattr(candidate, 'content') and candidate.content.parts:
+            for part in candidate.content.parts:
+                if hasattr(part, 'function_call') and part.function_call:
+                    # Execute the requested tool
+                    return await self._execute_tool_call(part.function_call)
+            
+            # Default to returning textual output
+            text = candidate.content.parts[0].text
+        else:
+            text = str(response.text) if hasattr(response, 'text') else ""
+        
+        if cache_key is not None and text:
+            self.response_cache.set(cache_key, text)
+        
+        return text
     
     async def _execute_tool_call(self, function_call) -> str:
         """Execute a tool invoked by the LLM.
@@ -270,30 +382,51 @@ class Agent:
         function_name = function_call.name
         args = dict(function_call.args) if hasattr(function_call, 'args') else {}
         
-        for tool in self.tools:
-            if hasattr(tool, 'name') and tool.name == function_name:
-                if hasattr(tool, 'execute'):
-                    result = await tool.execute(**args)
-                    return json.dumps(result)
-                elif hasattr(tool, 'func'):
-                    result = tool.func(**args)
-                    return json.dumps(result)
+        tool = self._tool_by_name.get(function_name)
+        if tool is not None:
+            if hasattr(tool, 'execute'):
+                result = await tool.execute(**args)
+                return _dumps(result)
+            elif hasattr(tool, 'func'):
+                result = tool.func(**args)
+                return _dumps(result)
         
-        return json.dumps({"error": f"Tool {function_name} not found"})
+        return _dumps({"error": f"Tool {function_name} not found"})
     
     async def _execute_sub_agents(self, parent_response: str) -> str:
-        """Run sub-agents sequentially using the parent agent's response.
+        """Run sub-agents using the parent agent's response.
 
-        Each sub-agent receives the same context and the
-        previous agent’s output as its prompt.
+        Each sub-agent receives the same context and the parent
+        agent's output as its prompt. Sub-agents therefore don't
+        depend on each other and, when `parallel` is set, are
+        dispatched concurrently; results keep declaration order.
         """
         results = [f"[{self.name} Initial Response]\n{parent_response}"]
         
-        for sub_agent in self.sub_agents:
-            result = await sub_agent.run(
-                prompt=parent_response,
-                context=self.context
-            )
+        # Every sub-agent sends the same full prompt; build its payload once
+        user_content = _build_user_content(parent_response + self._context_blob)
+        
+        if self.parallel:
+            sub_results = await asyncio.gather(*(
+                sub_agent.run(
+                    prompt=parent_response,
+                    context=self.context,
+                    context_blob=self._context_blob,
+                    user_content=user_content
+                )
+                for sub_agent in self.sub_agents
+            ))
+        else:
+            sub_results = []
+            for sub_agent in self.sub_agents:
+                sub_results.append(await sub_agent.run(
+                    prompt=parent_response,
+                    context=self.context,
+                    context_blob=self._context_blob,
+                    user_content=user_content
+                ))
+        
+        for sub_agent, result in zip(self.sub_agents, sub_results):
             response_text = result.get("response", "")
             results.append(f"\n[{sub_agent.name} Response]\n{response_text}")
         
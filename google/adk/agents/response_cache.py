@@ -0,0 +1,64 @@
+"""On-disk cache for LLM text responses."""
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+
+class ResponseCache:
+    """Content-addressed store mapping request hashes to response text.
+
+    Each entry is a file named by the hex digest of the request it
+    answers; entries older than `ttl` seconds are treated as misses.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl: float = 7 * 24 * 3600):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the request components (model, instructions, prompt, ...)."""
+        digest = hashlib.blake2b(digest_size=32)
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired.
+
+        Expired entries are deleted, so the directory doesn't keep
+        growing with responses that can never be served again.
+        """
+        path = self.directory / key
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def set(self, key: str, response: str):
+        """Store a response, replacing any previous entry atomically.
+
+        Best-effort: if the entry can't be written, the failure is
+        swallowed (the request is simply not cached) so callers still
+        get the response they already have.
+        """
+        path = self.directory / key
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(response, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def __repr__(self):
+        return f"ResponseCache(directory='{self.directory}')"
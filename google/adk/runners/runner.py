@@ -2,7 +2,7 @@
 import os
 import asyncio
 import logging
-from typing import Optional, AsyncIterator, Any, Dict
+from typing import Optional, AsyncIterator, Any, Dict, Tuple
 from google.genai import types as genai_types
 from google import genai
 
@@ -65,6 +65,43 @@ class Runner:
         **kwargs
     ) -> AsyncIterator[RunnerEvent]:
         """Execute agent and stream results."""
+        message_text, session = await self._prepare(user_id, session_id, new_message)
+        
+        # Yield intermediate events
+        yield RunnerEvent(
+            content=genai_types.Content(
+                role="assistant",
+                parts=[genai_types.Part.from_text(text=f"Processing with {self.agent.name}...")]
+            ),
+            agent_name=self.agent.name,
+            is_final=False
+        )
+        
+        yield await self._execute(user_id, session_id, message_text, session)
+    
+    async def run_once(
+        self,
+        user_id: str,
+        session_id: str,
+        new_message: genai_types.Content,
+        **kwargs
+    ) -> RunnerEvent:
+        """Execute agent and return only the final event.
+
+        Equivalent to the `run_async` event for which
+        `is_final_response()` is True, without the async-generator
+        protocol or the intermediate "Processing" event.
+        """
+        message_text, session = await self._prepare(user_id, session_id, new_message)
+        return await self._execute(user_id, session_id, message_text, session)
+    
+    async def _prepare(
+        self,
+        user_id: str,
+        session_id: str,
+        new_message: genai_types.Content
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Extract the message text, load the session and attach the client."""
         
         # Extract message text
         message_text = ""
@@ -89,18 +126,17 @@ class Runner:
         if self.client:
             await self.agent.initialize(self.client)
         
-        # Execute agent
+        return message_text, session
+    
+    async def _execute(
+        self,
+        user_id: str,
+        session_id: str,
+        message_text: str,
+        session: Optional[Dict[str, Any]]
+    ) -> RunnerEvent:
+        """Run the agent, record the exchange and build the final event."""
         try:
-            # Yield intermediate events
-            yield RunnerEvent(
-                content=genai_types.Content(
-                    role="assistant",
-                    parts=[genai_types.Part.from_text(text=f"Processing with {self.agent.name}...")]
-                ),
-                agent_name=self.agent.name,
-                is_final=False
-            )
-            
             # Run agent
             if self.client:
                 result = await self.agent.run(
@@ -129,8 +165,8 @@ class Runner:
                     content=response_text
                 )
             
-            # Yield final response
-            yield RunnerEvent(
+            # Final response
+            return RunnerEvent(
                 content=genai_types.Content(
                     role="assistant",
                     parts=[genai_types.Part.from_text(text=response_text)]
@@ -142,7 +178,7 @@ class Runner:
             
         except Exception as e:
             logger.error(f"Error running agent: {e}", exc_info=True)
-            yield RunnerEvent(
+            return RunnerEvent(
                 content=genai_types.Content(
                     role="assistant",
                     parts=[genai_types.Part.from_text(text=f"Error: {str(e)}")]
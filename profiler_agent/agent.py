@@ -1,7 +1,7 @@
-import datetime
-from google.adk.agents import Agent
+from google.adk.agents import Agent, ResponseCache
 from google.adk.tools import FunctionTool
 from .config import config
+from .paths import REPORTS_DIR
 from .sub_agents import taxonomist, trend_spotter, strategist
 from .tools import read_pdf_content, analyze_statistics, visualize_trends, compare_exams
 
@@ -9,7 +9,7 @@ professor_profiler_agent = Agent(
     name="professor_profiler_agent",
     model=config.analyzer_model,
     description="Main orchestrator. Ingests PDFs, classifies questions, finds trends, and creates study plans.",
-    instruction=f"""Workflow:
+    instruction="""Workflow:
 1. Use read_pdf_content tool to ingest exam paper PDFs
 2. Delegate to taxonomist sub-agent to classify questions by topic and Bloom's taxonomy
 3. Use analyze_statistics tool to compute frequency distributions
@@ -17,7 +17,7 @@ professor_profiler_agent = Agent(
 5. Use visualize_trends tool to create charts
 6. Delegate to strategist sub-agent to generate study recommendations
 
-Current date: {datetime.datetime.now().strftime('%Y-%m-%d')}
+Current date: {now}
 
 You have access to these tools:
 - read_pdf_content: Extract text from PDF files
@@ -30,6 +30,8 @@ Your sub-agents are:
 - trend_spotter: Analyzes trends (detailed analysis)
 - strategist: Generates study plans (actionable recommendations)""",
     sub_agents=[taxonomist, trend_spotter, strategist],
+    parallel=True,
+    response_cache=ResponseCache(REPORTS_DIR / ".llm_cache") if config.response_cache else None,
     tools=[
         FunctionTool(func=read_pdf_content),
         FunctionTool(func=analyze_statistics),
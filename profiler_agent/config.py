@@ -1,14 +1,18 @@
 import os
 from dataclasses import dataclass
-import google.auth
 
-try:
-    _, project_id = google.auth.default()
-except Exception:
-    # If Application Default Credentials are not available (e.g. in CI/local test),
-    # fall back to the env var or a sensible default so importing this module
-    # doesn't raise. Tests can override `GOOGLE_CLOUD_PROJECT` if needed.
-    project_id = os.environ.get("GOOGLE_CLOUD_PROJECT", "local")
+if "GOOGLE_CLOUD_PROJECT" in os.environ:
+    # Skip Application Default Credentials discovery (disk I/O and possibly a
+    # metadata-server probe) when the project is already configured.
+    project_id = os.environ["GOOGLE_CLOUD_PROJECT"]
+else:
+    try:
+        import google.auth
+        _, project_id = google.auth.default()
+    except Exception:
+        # If Application Default Credentials are not available (e.g. in CI/local test),
+        # fall back to a sensible default so importing this module doesn't raise.
+        project_id = "local"
 os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "global")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
@@ -17,5 +21,8 @@ os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 class ProfilerConfiguration:
     classifier_model: str = "gemini-2.0-flash-exp"
     analyzer_model: str = "gemini-2.0-pro-exp"
+    # Reuse LLM text responses from output/reports/.llm_cache; set
+    # PROFILER_RESPONSE_CACHE=0 to always call the model
+    response_cache: bool = os.environ.get("PROFILER_RESPONSE_CACHE", "1") != "0"
 
 config = ProfilerConfiguration()
@@ -16,13 +16,20 @@ LOGS_DIR = OUTPUT_DIR / "logs"
 REPORTS_DIR = OUTPUT_DIR / "reports"
 
 
+# Set once the directories have been created, so repeated path lookups
+# don't re-issue mkdir syscalls
+_DIRS_READY = False
+
+
 def ensure_directories():
     """Create input/output directories if they don't exist."""
-    INPUT_DIR.mkdir(parents=True, exist_ok=True)
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    CHARTS_DIR.mkdir(parents=True, exist_ok=True)
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    
+    for directory in (INPUT_DIR, OUTPUT_DIR, CHARTS_DIR, LOGS_DIR, REPORTS_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
 
 
 def get_input_path(filename: str) -> Path:
@@ -65,7 +72,7 @@ def list_input_files(extension: str = ".pdf") -> list:
     List all files in the input directory with given extension.
     
     Args:
-        extension: File extension to filter (default: .pdf)
+        extension: File extension to filter, case-insensitive (default: .pdf)
     
     Returns:
         List of Path objects for matching files
@@ -74,8 +81,14 @@ def list_input_files(extension: str = ".pdf") -> list:
     
     if not extension.startswith("."):
         extension = f".{extension}"
+    extension = extension.lower()
     
-    return list(INPUT_DIR.glob(f"*{extension}"))
+    # scandir yields DirEntry objects, so filtering needs no extra stat calls
+    with os.scandir(INPUT_DIR) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.lower().endswith(extension) and entry.is_file()
+        ]
 
 
 # Ensure directories exist on import
@@ -1,12 +1,101 @@
+import json
+from typing import Any, Dict, List, Optional
 from google.adk.agents import Agent
 from ..config import config
 from ..agent_utils import suppress_output_callback
+from ..tools import classify_bloom_levels
 
-taxonomist = Agent(
+
+class BloomPrefilterAgent(Agent):
+    """Agent that fills in Bloom's levels that follow from a question's verb.
+
+    The prompt is exam text, or a read_pdf_content result whose `content`
+    holds it. Questions are split out and their command verbs ("Define",
+    "Calculate", ...) tagged by `classify_bloom_levels`; the model is then
+    sent the questions as JSON with those levels filled in, and asked for
+    every topic and only the missing levels. Pre-filled levels are kept.
+    """
+
+    async def _generate_response(
+        self,
+        prompt: str,
+        context_blob: str,
+        system_instruction: str,
+        tool_config: Optional[Dict[str, Any]],
+        user_content=None
+    ) -> str:
+        tagged = classify_bloom_levels(_exam_text(prompt))["questions"]
+        if not tagged:
+            return await super()._generate_response(
+                prompt, context_blob, system_instruction, tool_config, user_content
+            )
+
+        request = [
+            {
+                "question": q["question"],
+                "bloom_level": None if q["bloom_level"] == "Unknown" else q["bloom_level"]
+            }
+            for q in tagged
+        ]
+        # The caller's prebuilt payload is for the raw prompt, so it is not reused
+        reply = await self._execute_llm(
+            self._build_full_prompt(json.dumps(request), context_blob),
+            system_instruction,
+            tool_config
+        )
+        model_tags = _parse_model_tags(reply, len(tagged))
+
+        result = {
+            "questions": [],
+            "model_classified": sum(q["bloom_level"] is None for q in request)
+        }
+        if not model_tags:
+            result["model_response"] = reply
+            model_tags = [{}] * len(tagged)
+
+        for q, tag in zip(request, model_tags):
+            result["questions"].append({
+                "question": q["question"],
+                "topic": tag.get("topic", "Unknown"),
+                "bloom_level": q["bloom_level"] or tag.get("bloom_level", "Unknown")
+            })
+
+        return json.dumps(result)
+
+
+def _exam_text(prompt: str) -> str:
+    """Return the exam text in a prompt, unwrapping a read_pdf_content result."""
+    try:
+        data = json.loads(prompt)
+    except ValueError:
+        return prompt
+    if isinstance(data, dict) and isinstance(data.get("content"), str):
+        return data["content"]
+    return prompt
+
+
+def _parse_model_tags(reply: str, expected: int) -> List[Dict[str, Any]]:
+    """Parse the model's JSON array of tags; [] unless it has one dict per question."""
+    text = reply.strip()
+    if text.startswith("```"):
+        # Drop a ```json ... ``` fence around the array
+        text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+    try:
+        tags = json.loads(text)
+    except ValueError:
+        return []
+    if not isinstance(tags, list) or len(tags) != expected:
+        return []
+    if not all(isinstance(tag, dict) for tag in tags):
+        return []
+    return tags
+
+
+taxonomist = BloomPrefilterAgent(
     model=config.classifier_model,
     name="taxonomist",
     description="Classifies educational questions by topic and cognitive difficulty.",
-    instruction="For every exam question provided, output tags for 'Topic' and 'Blooms Level' (Remember, Understand, Apply, Analyze). Do NOT answer the question.",
+    instruction="The exam questions are given as a JSON array of objects with 'question' and 'bloom_level'. For every question, output tags for 'Topic' and 'Blooms Level' (Remember, Understand, Apply, Analyze, Evaluate, Create), keeping any bloom_level already given and filling in those that are null. Reply with only a JSON array holding one object per question, in the order given, with keys 'question', 'topic' and 'bloom_level'. Do NOT answer the question.",
     output_key="tagged_questions",
-    after_agent_callback=suppress_output_callback 
+    after_agent_callback=suppress_output_callback
 )
@@ -1,10 +1,18 @@
 """Custom tools for the Professor Profiler agent."""
 import os
+import re
 import json
+import math
+import threading
+import multiprocessing
 from typing import Dict, List, Any
 from pathlib import Path
-from collections import Counter
-from .paths import get_input_path, get_output_path, list_input_files
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from xml.sax.saxutils import escape
+from .paths import INPUT_DIR, get_input_path, get_output_path, list_input_files
 
 try:
     from pypdf import PdfReader
@@ -12,82 +20,345 @@ except ImportError:
     PdfReader = None
 
 try:
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
+    import fitz  # PyMuPDF: C-backed extraction, preferred when installed
 except ImportError:
-    plt = None
+    fitz = None
 
 try:
-    import pandas as pd
+    import orjson
 except ImportError:
-    pd = None
+    orjson = None
 
+def _loads(data: str) -> Any:
+    """Decode agent-supplied JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-def read_pdf_content(file_path: str) -> dict:
+
+# pyplot is imported on first chart render; see _get_plt
+_PLT = None
+
+
+def _get_plt():
+    """Import pyplot with the non-interactive backend, or return None if unavailable."""
+    global _PLT
+    if _PLT is None:
+        try:
+            import matplotlib
+            matplotlib.use('Agg')  # Non-interactive backend
+            import matplotlib.pyplot as plt
+        except ImportError:
+            return None
+        _PLT = plt
+    return _PLT
+
+
+def read_pdf_content(
+    file_path: str,
+    max_pages: int = 0,
+    need_text: bool = True,
+    include_content: bool = True
+) -> dict:
     """
     Extract text content from a PDF file.
     
     Args:
         file_path: Path to the PDF file (relative to input/ folder or absolute path)
+        max_pages: Extract text from at most this many leading pages (0 = all)
+        need_text: If False, skip text extraction and return metadata only
+        include_content: If False, return content_length instead of the text
     
     Returns:
         Dictionary with filename and content, or error message
     """
-    if PdfReader is None:
+    if PdfReader is None and fitz is None:
         return {"error": "pypdf library is not installed."}
     
-    # If path is relative (no directory separator), look in input/ folder
-    path = Path(file_path)
-    if not path.is_absolute() and not os.path.exists(file_path):
-        # Try looking in input directory
-        input_file = get_input_path(file_path)
-        if input_file.exists():
-            file_path = str(input_file)
+    try:
+        stat, resolved_path = _resolve_pdf_path(file_path)
+    except OSError as e:
+        return {"error": f"Failed to read PDF: {str(e)}"}
+    
+    if stat is None:
+        if os.path.isabs(file_path):
+            return {"error": f"File not found: {file_path}"}
+        return {
+            "error": f"File not found: {file_path}. Please place exam PDFs in the 'input/' folder."
+        }
+    
+    # Repeat reads of an unchanged file are served from the extraction cache.
+    # A length-only read uses the full text if that is already cached, and
+    # otherwise counts the text without building it.
+    key = _pdf_cache_key(resolved_path, stat, max_pages, need_text)
+    if not include_content:
+        with _PDF_CACHE_LOCK:
+            full = _PDF_CACHE.get(key)
+            if full is not None:
+                _PDF_CACHE.move_to_end(key)
+        if full is None:
+            result = _cached_extract(_pdf_cache_key(resolved_path, stat, max_pages, need_text, False))
         else:
-            return {
-                "error": f"File not found: {file_path}. Please place exam PDFs in the 'input/' folder."
-            }
+            result = {**full, "content_length": len(full["content"])}
+            del result["content"]
+        if "error" in result:
+            return result
+        return {**result, "file_path": resolved_path}
     
-    if not os.path.exists(file_path):
-        return {"error": f"File not found: {file_path}"}
+    result = _cached_extract(key)
+    if "error" in result:
+        return result
     
+    return {**result, "file_path": resolved_path}
+
+
+def _resolve_pdf_path(file_path: str) -> tuple:
+    """
+    Stat file_path, falling back to the input/ folder for relative paths.
+    
+    Returns (stat_result, path) for the first candidate that exists, or
+    (None, None). Costs one stat call, two when the fallback is tried.
+    Unusable paths (e.g. containing a NUL byte) count as missing.
+    """
     try:
-        reader = PdfReader(file_path)
-        text = ""
-        page_count = len(reader.pages)
+        return os.stat(file_path), file_path
+    except (FileNotFoundError, ValueError):
+        if os.path.isabs(file_path):
+            return None, None
+    
+    input_file = str(get_input_path(file_path))
+    try:
+        return os.stat(input_file), input_file
+    except (FileNotFoundError, ValueError):
+        return None, None
+
+
+# Successful extractions keyed on (abs_path, mtime_ns, size, max_pages,
+# need_text, include_content), least recently used first. A modified file
+# gets a new key, so stale text is never returned; failures are not stored
+# and are retried. The cache holds at most _PDF_CACHE_SIZE entries and
+# _PDF_CACHE_MAX_CHARS characters of extracted text.
+_PDF_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_PDF_CACHE_SIZE = 64
+_PDF_CACHE_MAX_CHARS = 16 << 20
+_PDF_CACHE_LOCK = threading.Lock()
+
+
+def _pdf_cache_key(
+    path: str,
+    stat: os.stat_result,
+    max_pages: int = 0,
+    need_text: bool = True,
+    include_content: bool = True
+) -> tuple:
+    """Build the extraction cache key for a resolved path and its stat result."""
+    return (
+        os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+        int(max_pages or 0), bool(need_text), bool(include_content)
+    )
+
+
+def _cached_extract(key: tuple) -> dict:
+    """
+    Return the extraction for a cache key, extracting and storing on a miss.
+    
+    Cached dicts are shared: callers must copy them before handing them out.
+    """
+    with _PDF_CACHE_LOCK:
+        result = _PDF_CACHE.get(key)
+        if result is not None:
+            _PDF_CACHE.move_to_end(key)
+            return result
+    
+    result = _extract_pdf(*key)
+    _store_extraction(key, result)
+    return result
+
+
+def _store_extraction(key: tuple, result: dict):
+    """Add a successful extraction to the cache, evicting the oldest entries if full."""
+    if "error" in result or len(result.get("content", "")) > _PDF_CACHE_MAX_CHARS:
+        return
+    with _PDF_CACHE_LOCK:
+        _PDF_CACHE[key] = result
+        _PDF_CACHE.move_to_end(key)
+        chars = sum(len(entry.get("content", "")) for entry in _PDF_CACHE.values())
+        while len(_PDF_CACHE) > _PDF_CACHE_SIZE or chars > _PDF_CACHE_MAX_CHARS:
+            _, evicted = _PDF_CACHE.popitem(last=False)
+            chars -= len(evicted.get("content", ""))
+
+
+def _extract_pdf(
+    abs_path: str,
+    mtime_ns: int,
+    size: int,
+    max_pages: int = 0,
+    need_text: bool = True,
+    include_content: bool = True
+) -> dict:
+    """
+    Extract text from a PDF; takes the fields of an extraction cache key.
+    
+    `page_count` is always the document's total, however many pages
+    were read. `mtime_ns` and `size` only serve to key the cache. With
+    include_content False the result has `content_length` in place of
+    `content`, counted without joining the pages.
+    """
+    try:
+        # Reject non-PDF files before the parser walks their bytes
+        with open(abs_path, "rb") as fh:
+            if not fh.read(5).startswith(b"%PDF-"):
+                return {"error": f"Not a valid PDF: {abs_path}"}
+        
+        if fitz is not None:
+            with fitz.open(abs_path) as doc:
+                page_count = doc.page_count
+                stop = min(max_pages or page_count, page_count) if need_text else 0
+                page_texts = [doc[i].get_text() for i in range(stop)]
+        else:
+            reader = PdfReader(abs_path)
+            page_count = len(reader.pages)
+            stop = min(max_pages or page_count, page_count) if need_text else 0
+            page_texts = [reader.pages[i].extract_text() for i in range(stop)]
         
-        for page_num, page in enumerate(reader.pages, 1):
-            page_text = page.extract_text()
-            text += f"\n--- Page {page_num} ---\n{page_text}"
+        parts: List[str] = []
+        for page_num, page_text in enumerate(page_texts, 1):
+            parts.extend((f"\n--- Page {page_num} ---\n", page_text))
+        
+        if not include_content:
+            return {
+                "filename": os.path.basename(abs_path),
+                "content_length": sum(map(len, parts)),
+                "page_count": page_count
+            }
         
         return {
-            "filename": os.path.basename(file_path),
-            "content": text,
-            "page_count": page_count,
-            "file_path": file_path
+            "filename": os.path.basename(abs_path),
+            "content": "".join(parts),
+            "page_count": page_count
         }
     except Exception as e:
         return {"error": f"Failed to read PDF: {str(e)}"}
 
 
+# Leading command verbs whose Bloom's level is unambiguous
+BLOOM_VERBS = {
+    "define": "Remember", "state": "Remember", "list": "Remember",
+    "name": "Remember", "recall": "Remember", "identify": "Remember",
+    "explain": "Understand", "describe": "Understand",
+    "compare": "Understand", "contrast": "Understand",
+    "calculate": "Apply", "compute": "Apply", "apply": "Apply", "use": "Apply",
+    "analyze": "Analyze", "analyse": "Analyze",
+    "evaluate": "Evaluate",
+    "design": "Create", "create": "Create",
+}
+
+# Optional question number ("3.", "Q3)", "Question 3.") followed by a known verb
+_BLOOM_RE = re.compile(
+    r"^\s*(?:Q(?:uestion)?\s*)?\d*[.)]?\s*(" + "|".join(BLOOM_VERBS) + r")\b",
+    re.IGNORECASE
+)
+_NUMBERED_RE = re.compile(r"^\s*(?:Q(?:uestion)?\s*)?\d+[.)]\s", re.IGNORECASE)
+# Page separator inserted by read_pdf_content
+_PAGE_MARKER_RE = re.compile(r"^--- Page \d+ ---$")
+
+
+def classify_bloom_levels(questions_text: str) -> dict:
+    """
+    Tag exam questions with Bloom's levels from their leading command verb.
+    
+    Args:
+        questions_text: Exam text with one question per line. When some lines
+            are numbered ("1.", "Q2)"), each numbered line starts a question,
+            unnumbered lines continue the one before, and text ahead of the
+            first question (headers, instructions) is skipped.
+    
+    Returns:
+        Dictionary with tagged questions; questions without a recognised
+        leading verb get bloom_level "Unknown" and need model classification
+    """
+    lines = [line.strip() for line in questions_text.splitlines()]
+    lines = [line for line in lines if line and not _PAGE_MARKER_RE.match(line)]
+    
+    if any(_NUMBERED_RE.match(line) for line in lines):
+        questions = []
+        for line in lines:
+            if _NUMBERED_RE.match(line):
+                questions.append(line)
+            elif questions:
+                questions[-1] += " " + line
+    else:
+        questions = lines
+    
+    tagged = []
+    matched = 0
+    for text in questions:
+        match = _BLOOM_RE.match(text)
+        if match:
+            matched += 1
+            bloom_level = BLOOM_VERBS[match.group(1).lower()]
+        else:
+            bloom_level = "Unknown"
+        tagged.append({"question": text, "bloom_level": bloom_level})
+    
+    return {
+        "questions": tagged,
+        "matched": matched,
+        "unmatched": len(tagged) - matched
+    }
+
+
+# Bloom's levels grouped by cognitive order
+LOWER_ORDER_LEVELS = frozenset({"remember", "understand"})
+HIGHER_ORDER_LEVELS = frozenset({"apply", "analyze", "evaluate", "create"})
+
+
+class Question:
+    """Compact record for a tagged question, for callers building data in Python."""
+    __slots__ = ("topic", "bloom_level", "text")
+    
+    def __init__(self, topic: str = "Unknown", bloom_level: str = "Unknown", text: str = ""):
+        self.topic = topic
+        self.bloom_level = bloom_level
+        self.text = text
+    
+    def __repr__(self):
+        return f"Question(topic='{self.topic}', bloom_level='{self.bloom_level}')"
+
+
 def analyze_statistics(questions_data: str) -> dict:
     """
     Analyze statistical patterns in exam questions.
     
     Args:
-        questions_data: JSON string or dict containing tagged questions
+        questions_data: JSON string containing tagged questions (already
+            parsed data is passed straight to analyze_statistics_dict)
+    
+    Returns:
+        Statistical analysis including frequency distributions
+    """
+    if not isinstance(questions_data, str):
+        return analyze_statistics_dict(questions_data)
+    
+    try:
+        data = _loads(questions_data)
+    except ValueError as e:
+        return {"error": f"Failed to analyze statistics: {str(e)}"}
+    return analyze_statistics_dict(data)
+
+
+def analyze_statistics_dict(data: dict) -> dict:
+    """
+    Analyze statistical patterns in already-parsed exam questions.
+    
+    Args:
+        data: Dict with a "questions" list, or the list itself (of dicts or
+            Question records)
     
     Returns:
         Statistical analysis including frequency distributions
     """
     try:
-        # Parse input if it's a string
-        if isinstance(questions_data, str):
-            data = json.loads(questions_data)
-        else:
-            data = questions_data
-        
         # Extract topics and bloom levels
         topics = []
         bloom_levels = []
@@ -99,52 +370,103 @@ def analyze_statistics(questions_data: str) -> dict:
         else:
             return {"error": "Invalid input format"}
         
-        for q in questions:
-            if isinstance(q, dict):
-                topics.append(q.get("topic", "Unknown"))
-                bloom_levels.append(q.get("bloom_level", "Unknown"))
+        if questions and isinstance(questions[0], Question):
+            # All-Question list: plain attribute reads, no per-item type checks.
+            # Anything without the attributes means a mixed list; redo it below.
+            try:
+                topics = [q.topic for q in questions]
+                bloom_levels = [q.bloom_level for q in questions]
+            except AttributeError:
+                topics, bloom_levels = [], []
+        
+        if not topics:
+            for q in questions:
+                if isinstance(q, dict):
+                    topics.append(q.get("topic", "Unknown"))
+                    bloom_levels.append(q.get("bloom_level", "Unknown"))
+                elif isinstance(q, Question):
+                    topics.append(q.topic)
+                    bloom_levels.append(q.bloom_level)
         
         # Calculate statistics
         topic_freq = Counter(topics)
         bloom_freq = Counter(bloom_levels)
         
+        # Split by cognitive order in one pass over the distinct levels
+        lower_order = higher_order = 0
+        for level, count in bloom_freq.items():
+            level = level.lower()
+            if level in LOWER_ORDER_LEVELS:
+                lower_order += count
+            elif level in HIGHER_ORDER_LEVELS:
+                higher_order += count
+        
         return {
             "total_questions": len(questions),
             "topic_distribution": dict(topic_freq),
             "bloom_distribution": dict(bloom_freq),
             "top_topics": topic_freq.most_common(5),
             "cognitive_complexity": {
-                "lower_order": sum(
-                    count for level, count in bloom_freq.items()
-                    if level.lower() in ["remember", "understand"]
-                ),
-                "higher_order": sum(
-                    count for level, count in bloom_freq.items()
-                    if level.lower() in ["apply", "analyze", "evaluate", "create"]
-                )
+                "lower_order": lower_order,
+                "higher_order": higher_order
             }
         }
     except Exception as e:
         return {"error": f"Failed to analyze statistics: {str(e)}"}
 
 
+# One figure is reused across charts (figure setup is costly); pyplot state
+# is not thread-safe, so all drawing happens under the lock
+_FIG = None
+_AXES = None
+_FIG_LOCK = threading.Lock()
+
+
 def visualize_trends(
     statistics: str,
     output_path: str = "trends_chart.png",
-    chart_type: str = "bar"
+    chart_type: str = "bar",
+    chart_backend: str = "mpl"
 ) -> dict:
     """
     Create visualizations for exam trends.
     
     Args:
-        statistics: JSON string containing statistical data
+        statistics: JSON string containing statistical data (already parsed
+            data is passed straight to visualize_trends_dict)
         output_path: Path to save the chart (saved to output/charts/ by default)
         chart_type: Type of chart ('bar', 'pie', 'line')
+        chart_backend: 'mpl' renders a PNG with Matplotlib; 'svg' writes an
+            SVG file directly, without importing or rendering through Matplotlib
     
     Returns:
         Dictionary with chart path and metadata
     """
-    if plt is None:
+    if not isinstance(statistics, str):
+        return visualize_trends_dict(statistics, output_path, chart_type, chart_backend)
+    
+    try:
+        stats = _loads(statistics)
+    except ValueError as e:
+        return {"error": f"Failed to create visualization: {str(e)}"}
+    return visualize_trends_dict(stats, output_path, chart_type, chart_backend)
+
+
+def visualize_trends_dict(
+    stats: dict,
+    output_path: str = "trends_chart.png",
+    chart_type: str = "bar",
+    chart_backend: str = "mpl"
+) -> dict:
+    """
+    Create visualizations from already-parsed statistics.
+    
+    Takes the same arguments as visualize_trends, with the output of
+    analyze_statistics as a dict.
+    """
+    if chart_backend not in ("mpl", "svg"):
+        return {"error": f"Unknown chart_backend: {chart_backend} (expected 'mpl' or 'svg')"}
+    if chart_backend == "mpl" and _get_plt() is None:
         return {"error": "matplotlib library is not installed"}
     
     try:
@@ -152,49 +474,14 @@ def visualize_trends(
         if not os.path.dirname(output_path):
             output_path = str(get_output_path(output_path, "charts"))
         
-        # Parse statistics
-        if isinstance(statistics, str):
-            stats = json.loads(statistics)
+        if chart_backend == "svg":
+            svg_path = Path(output_path).with_suffix(".svg")
+            svg_path.parent.mkdir(parents=True, exist_ok=True)
+            svg_path.write_text(_render_trends_svg(stats, chart_type), encoding="utf-8")
+            output_path = str(svg_path)
         else:
-            stats = statistics
-        
-        # Create figure with subplots
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-        
-        # Plot 1: Topic Distribution
-        if "topic_distribution" in stats:
-            topics = list(stats["topic_distribution"].keys())
-            counts = list(stats["topic_distribution"].values())
-            
-            if chart_type == "bar":
-                axes[0].bar(topics, counts, color='skyblue')
-                axes[0].set_xlabel('Topics')
-                axes[0].set_ylabel('Frequency')
-                axes[0].set_title('Topic Distribution')
-                axes[0].tick_params(axis='x', rotation=45)
-            elif chart_type == "pie":
-                axes[0].pie(counts, labels=topics, autopct='%1.1f%%')
-                axes[0].set_title('Topic Distribution')
-        
-        # Plot 2: Bloom's Taxonomy Distribution
-        if "bloom_distribution" in stats:
-            blooms = list(stats["bloom_distribution"].keys())
-            bloom_counts = list(stats["bloom_distribution"].values())
-            
-            axes[1].bar(blooms, bloom_counts, color='lightcoral')
-            axes[1].set_xlabel('Bloom\'s Level')
-            axes[1].set_ylabel('Frequency')
-            axes[1].set_title('Cognitive Complexity Distribution')
-            axes[1].tick_params(axis='x', rotation=45)
-        
-        plt.tight_layout()
-        
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
-        
-        # Save figure
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
+            with _FIG_LOCK:
+                _draw_trends(stats, output_path, chart_type)
         
         return {
             "chart_path": output_path,
@@ -207,12 +494,231 @@ def visualize_trends(
         return {"error": f"Failed to create visualization: {str(e)}"}
 
 
-def compare_exams(exam_files: List[str]) -> dict:
+def _draw_trends(stats: dict, output_path: str, chart_type: str):
+    """Draw the two-panel trends chart on the shared figure and save it."""
+    global _FIG, _AXES
+    plt = _get_plt()
+    
+    # Create the figure on first use, otherwise reset both panels. Margins
+    # are fixed, so no tight_layout pass is needed; the tight bbox on save
+    # still takes in long rotated tick labels that fall outside them.
+    if _FIG is None:
+        _FIG, _AXES = plt.subplots(1, 2, figsize=(14, 6))
+        _FIG.subplots_adjust(left=0.08, right=0.98, top=0.92, bottom=0.22, wspace=0.25)
+    else:
+        for ax in _AXES:
+            ax.clear()
+            # clear() keeps the equal aspect and hidden frame a pie chart sets
+            ax.set_aspect('auto')
+            ax.set_frame_on(True)
+    axes = _AXES
+    
+    # Plot 1: Topic Distribution
+    if "topic_distribution" in stats:
+        topics = list(stats["topic_distribution"].keys())
+        counts = list(stats["topic_distribution"].values())
+        
+        if chart_type == "bar":
+            axes[0].bar(topics, counts, color='skyblue')
+            axes[0].set_xlabel('Topics')
+            axes[0].set_ylabel('Frequency')
+            axes[0].set_title('Topic Distribution')
+            axes[0].tick_params(axis='x', rotation=45)
+        elif chart_type == "pie":
+            axes[0].pie(counts, labels=topics, autopct='%1.1f%%')
+            axes[0].set_title('Topic Distribution')
+    
+    # Plot 2: Bloom's Taxonomy Distribution
+    if "bloom_distribution" in stats:
+        blooms = list(stats["bloom_distribution"].keys())
+        bloom_counts = list(stats["bloom_distribution"].values())
+        
+        axes[1].bar(blooms, bloom_counts, color='lightcoral')
+        axes[1].set_xlabel('Bloom\'s Level')
+        axes[1].set_ylabel('Frequency')
+        axes[1].set_title('Cognitive Complexity Distribution')
+        axes[1].tick_params(axis='x', rotation=45)
+    
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else ".", exist_ok=True)
+    
+    # Save figure; it stays open for the next chart
+    _FIG.savefig(output_path, dpi=150, bbox_inches='tight')
+
+
+# Panel geometry for SVG charts: two 700x600 panels side by side
+_SVG_PANEL_WIDTH = 700
+_SVG_HEIGHT = 600
+
+# Matplotlib's default colour cycle, used for pie slices
+_SVG_PALETTE = (
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+    "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf",
+)
+
+
+def _render_trends_svg(stats: dict, chart_type: str) -> str:
+    """Build the two-panel trends chart as an SVG document."""
+    elements = []
+    
+    # Panel 1: Topic Distribution
+    if "topic_distribution" in stats:
+        topics = list(stats["topic_distribution"].keys())
+        counts = list(stats["topic_distribution"].values())
+        
+        if chart_type == "bar":
+            elements += _svg_bar_panel(0, topics, counts, "skyblue", "Topic Distribution", "Topics")
+        elif chart_type == "pie":
+            elements += _svg_pie_panel(0, topics, counts, "Topic Distribution")
+    
+    # Panel 2: Bloom's Taxonomy Distribution
+    if "bloom_distribution" in stats:
+        blooms = list(stats["bloom_distribution"].keys())
+        bloom_counts = list(stats["bloom_distribution"].values())
+        elements += _svg_bar_panel(
+            _SVG_PANEL_WIDTH, blooms, bloom_counts, "lightcoral",
+            "Cognitive Complexity Distribution", "Bloom's Level"
+        )
+    
+    width = 2 * _SVG_PANEL_WIDTH
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{_SVG_HEIGHT}" '
+        f'viewBox="0 0 {width} {_SVG_HEIGHT}" font-family="sans-serif">\n'
+        f'<rect width="{width}" height="{_SVG_HEIGHT}" fill="white"/>\n'
+        + "\n".join(elements)
+        + "\n</svg>\n"
+    )
+
+
+def _svg_bar_panel(x0: float, labels: list, counts: list, color: str, title: str, xlabel: str) -> List[str]:
+    """SVG elements for a bar chart panel whose left edge is at x0."""
+    left, top, width, height = x0 + 70, 50, _SVG_PANEL_WIDTH - 100, 400
+    bottom = top + height
+    elements = [
+        f'<text x="{x0 + _SVG_PANEL_WIDTH / 2}" y="30" font-size="16" text-anchor="middle">{escape(title)}</text>',
+        f'<path d="M{left},{top} V{bottom} H{left + width}" fill="none" stroke="black"/>',
+        f'<text x="{x0 + 20}" y="{top + height / 2}" font-size="13" text-anchor="middle" '
+        f'transform="rotate(-90 {x0 + 20} {top + height / 2})">Frequency</text>',
+        f'<text x="{left + width / 2}" y="{_SVG_HEIGHT - 10}" font-size="13" text-anchor="middle">{escape(xlabel)}</text>',
+    ]
+    
+    peak = max(counts, default=0) or 1
+    slot = width / max(len(counts), 1)
+    for i, (label, count) in enumerate(zip(labels, counts)):
+        bar_height = height * count / peak
+        center = left + slot * (i + 0.5)
+        elements.append(
+            f'<rect x="{center - slot * 0.4:.1f}" y="{bottom - bar_height:.1f}" '
+            f'width="{slot * 0.8:.1f}" height="{bar_height:.1f}" fill="{color}"/>'
+        )
+        elements.append(
+            f'<text x="{center:.1f}" y="{bottom - bar_height - 5:.1f}" font-size="11" '
+            f'text-anchor="middle">{count}</text>'
+        )
+        elements.append(
+            f'<text x="{center:.1f}" y="{bottom + 15}" font-size="11" text-anchor="end" '
+            f'transform="rotate(-45 {center:.1f} {bottom + 15})">{escape(str(label))}</text>'
+        )
+    
+    return elements
+
+
+def _svg_pie_panel(x0: float, labels: list, counts: list, title: str) -> List[str]:
+    """SVG elements for a pie chart panel whose left edge is at x0."""
+    cx, cy, radius = x0 + _SVG_PANEL_WIDTH / 2, 310, 200
+    elements = [
+        f'<text x="{cx}" y="30" font-size="16" text-anchor="middle">{escape(title)}</text>',
+    ]
+    
+    total = sum(counts)
+    if total <= 0:
+        return elements
+    
+    # Slices run counter-clockwise from 3 o'clock, as in Matplotlib
+    angle = 0.0
+    for i, (label, count) in enumerate(zip(labels, counts)):
+        fraction = count / total
+        sweep = 2 * math.pi * fraction
+        color = _SVG_PALETTE[i % len(_SVG_PALETTE)]
+        
+        if fraction >= 1:
+            elements.append(f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="{color}"/>')
+        elif fraction > 0:
+            x1, y1 = cx + radius * math.cos(angle), cy - radius * math.sin(angle)
+            x2, y2 = cx + radius * math.cos(angle + sweep), cy - radius * math.sin(angle + sweep)
+            large_arc = 1 if sweep > math.pi else 0
+            elements.append(
+                f'<path d="M{cx},{cy} L{x1:.1f},{y1:.1f} '
+                f'A{radius},{radius} 0 {large_arc},0 {x2:.1f},{y2:.1f} Z" fill="{color}"/>'
+            )
+        
+        # Percentage inside the slice, label just outside it
+        middle = angle + sweep / 2
+        cos_mid, sin_mid = math.cos(middle), math.sin(middle)
+        elements.append(
+            f'<text x="{cx + 0.6 * radius * cos_mid:.1f}" y="{cy - 0.6 * radius * sin_mid:.1f}" '
+            f'font-size="11" text-anchor="middle">{fraction * 100:.1f}%</text>'
+        )
+        anchor = "start" if cos_mid >= 0 else "end"
+        elements.append(
+            f'<text x="{cx + 1.1 * radius * cos_mid:.1f}" y="{cy - 1.1 * radius * sin_mid:.1f}" '
+            f'font-size="12" text-anchor="{anchor}">{escape(str(label))}</text>'
+        )
+        angle += sweep
+    
+    return elements
+
+
+# compare_exams(parallel=True) parses uncached files at least this large in
+# worker processes
+_POOL_MIN_BYTES = 1 << 20
+
+# Worker pool shared by compare_exams calls, started on first use and grown
+# when a call has more files than workers. Workers are spawned rather than
+# forked, since the agent process is multi-threaded.
+_POOL = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+# Set once the pool breaks; from then on files are parsed in this process
+_POOL_DISABLED = False
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared PDF parsing pool with at least `workers` processes."""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS < workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            _POOL_WORKERS = workers
+    return _POOL
+
+
+def _disable_pool():
+    """Shut down a broken pool and stop using worker processes."""
+    global _POOL, _POOL_WORKERS, _POOL_DISABLED
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+            _POOL_WORKERS = 0
+        _POOL_DISABLED = True
+
+
+def compare_exams(exam_files: List[str], parallel: bool = False) -> dict:
     """
     Compare multiple exam papers to identify trends over time.
     
     Args:
         exam_files: List of PDF file paths to compare
+        parallel: Parse large uncached files in worker processes. Workers
+            re-import the main module, so a calling script must guard its
+            entry point with `if __name__ == "__main__":`.
     
     Returns:
         Comparison analysis with trends
@@ -220,15 +726,42 @@ def compare_exams(exam_files: List[str]) -> dict:
     if not exam_files:
         return {"error": "No exam files provided"}
     
-    results = []
+    # Only text lengths are compared, so no text is built or cached unless a
+    # full read of the file already is
+    read_summary = partial(read_pdf_content, include_content=False)
+    
+    # Cached and small files are extracted in this process (a cache hit, or a
+    # parse that costs less than dispatching it); large uncached ones are pooled
+    pooled_keys = []
+    if parallel and not _POOL_DISABLED:
+        for exam_file in exam_files:
+            stat, resolved_path = _resolve_pdf_path(exam_file)
+            if stat is not None and stat.st_size >= _POOL_MIN_BYTES:
+                key = _pdf_cache_key(resolved_path, stat, include_content=False)
+                if key not in _PDF_CACHE and key[:-1] + (True,) not in _PDF_CACHE:
+                    pooled_keys.append(key)
+    
+    # Parsing is CPU-bound and independent per file; a lone file isn't worth
+    # dispatching. Workers send back lengths only, which seed this cache.
+    if len(pooled_keys) > 1:
+        workers = min(len(pooled_keys), os.cpu_count() or 1)
+        try:
+            extractions = _get_pool(workers).map(_extract_pdf, *zip(*pooled_keys))
+            for key, result in zip(pooled_keys, extractions):
+                _store_extraction(key, result)
+        except BrokenProcessPool:
+            # e.g. the calling script can't be re-imported by spawned workers
+            _disable_pool()
     
-    for file_path in exam_files:
-        content = read_pdf_content(file_path)
+    contents = [read_summary(exam_file) for exam_file in exam_files]
+    
+    results = []
+    for content in contents:
         if "error" not in content:
             results.append({
                 "file": content["filename"],
                 "page_count": content.get("page_count", 0),
-                "content_length": len(content.get("content", ""))
+                "content_length": content.get("content_length", 0)
             })
     
     return {
@@ -238,6 +771,11 @@ def compare_exams(exam_files: List[str]) -> dict:
     }
 
 
+# Last input/ listing, reused while the directory's mtime is unchanged
+# (adding, removing or renaming a file bumps it)
+_LIST_CACHE = {"mtime_ns": -1, "files": []}
+
+
 def list_available_exams() -> dict:
     """
     List all PDF files available in the input directory.
@@ -246,7 +784,11 @@ def list_available_exams() -> dict:
         Dictionary with list of available exam files
     """
     try:
-        pdf_files = list_input_files(".pdf")
+        mtime_ns = os.stat(INPUT_DIR).st_mtime_ns
+        if mtime_ns != _LIST_CACHE["mtime_ns"]:
+            _LIST_CACHE["files"] = sorted(list_input_files(".pdf"))
+            _LIST_CACHE["mtime_ns"] = mtime_ns
+        pdf_files = _LIST_CACHE["files"]
         
         return {
             "count": len(pdf_files),
@@ -22,6 +22,10 @@ setup(
     version="1.0.0",
     packages=find_packages(exclude=['tests', 'tests.*']),
     install_requires=read_requirements(),
+    extras_require={
+        # Faster PDF text extraction via MuPDF, faster JSON via orjson
+        'fast': ['pymupdf', 'orjson'],
+    },
     python_requires='>=3.10',
     author="Professor Profiler Team",
     description="Multi-agent exam analysis system powered by Google Gemini",
@@ -12,6 +12,9 @@ repo_root = Path(__file__).resolve().parent.parent
 if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
 
+# Keep test runs from reading or writing the on-disk LLM response cache
+os.environ.setdefault("PROFILER_RESPONSE_CACHE", "0")
+
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from profiler_agent.agent import root_agent
@@ -93,7 +96,7 @@ async def test_tools():
     print("TEST 3: Custom Tools")
     print("-" * 60)
     
-    from profiler_agent.tools import read_pdf_content, analyze_statistics
+    from profiler_agent.tools import read_pdf_content, analyze_statistics, classify_bloom_levels, Question
     import json
     
     # Ensure mock file exists
@@ -119,6 +122,18 @@ async def test_tools():
     assert "total_questions" in stats
     assert stats["total_questions"] == 2
     print(f"✅ Statistics tool executed: {stats['total_questions']} questions")
+    
+    records = [Question("Math", "Apply"), Question("Physics", "Remember")]
+    assert analyze_statistics(records)["cognitive_complexity"] == {"lower_order": 1, "higher_order": 1}
+    mixed = [records[0], {"topic": "Physics", "bloom_level": "Remember"}]
+    assert analyze_statistics(mixed)["topic_distribution"] == {"Math": 1, "Physics": 1}
+    assert analyze_statistics(mixed[::-1])["topic_distribution"] == {"Physics": 1, "Math": 1}
+    
+    # Test rule-based Bloom tagging
+    tagged = classify_bloom_levels("1. Define entropy.\n2. Why is the sky blue?")
+    assert tagged["questions"][0]["bloom_level"] == "Remember"
+    assert tagged["unmatched"] == 1
+    print(f"✅ Bloom tagging tool executed: {tagged['matched']} matched")
     print()
 
 
@@ -203,6 +218,285 @@ async def test_memory_bank():
     print()
 
 
+async def test_runner_run_once():
+    """Test single-shot runner execution."""
+    print("TEST 6: Runner Single-Shot Execution")
+    print("-" * 60)
+    
+    session_service = InMemorySessionService()
+    runner = Runner(
+        agent=root_agent,
+        app_name="test_app",
+        session_service=session_service
+    )
+    
+    event = await runner.run_once(
+        user_id="test_user",
+        session_id="test_once",
+        new_message=genai_types.Content(
+            role="user",
+            parts=[genai_types.Part.from_text(text="List available exams")]
+        )
+    )
+    
+    assert event.is_final_response()
+    assert event.content.parts[0].text
+    
+    messages = await session_service.get_messages(
+        app_name="test_app",
+        user_id="test_user",
+        session_id="test_once"
+    )
+    assert len(messages) == 2
+    print(f"✅ Final event returned: {event}")
+    print()
+
+
+async def test_pdf_extraction_cache():
+    """Test memoization of PDF text extraction."""
+    print("TEST 7: PDF Extraction Cache")
+    print("-" * 60)
+    
+    from pypdf import PdfWriter
+    from profiler_agent import tools
+    
+    test_file = "tests/sample_data/cache_test.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    with open(test_file, "wb") as f:
+        writer.write(f)
+    tools._PDF_CACHE.clear()
+    
+    # Repeat read of an unchanged file is served from the cache
+    first = tools.read_pdf_content(test_file)
+    assert first["page_count"] == 1
+    cached = next(iter(tools._PDF_CACHE.values()))
+    second = tools.read_pdf_content(test_file)
+    assert len(tools._PDF_CACHE) == 1
+    assert next(iter(tools._PDF_CACHE.values())) is cached
+    print("✅ Repeat read hit the cache")
+    
+    # Mutating a returned dict leaves the cached entry intact
+    second["page_count"] = 99
+    second["content"] = "mutated"
+    third = tools.read_pdf_content(test_file)
+    assert third["page_count"] == 1 and third["content"] != "mutated"
+    print("✅ Cached entry unaffected by caller mutation")
+    
+    # Touching the file changes its key, so the next read misses
+    stat = os.stat(test_file)
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    tools.read_pdf_content(test_file)
+    assert len(tools._PDF_CACHE) == 2
+    print("✅ Modified file re-extracted")
+    
+    # A length-only read reuses the cached text, or counts it without storing it
+    full = tools.read_pdf_content(test_file)
+    summary = tools.read_pdf_content(test_file, include_content=False)
+    assert summary["content_length"] == len(full["content"]) and "content" not in summary
+    assert len(tools._PDF_CACHE) == 2
+    tools._PDF_CACHE.clear()
+    assert tools.read_pdf_content(test_file, include_content=False) == summary
+    assert "content" not in next(iter(tools._PDF_CACHE.values()))
+    print("✅ Length-only read served without caching text")
+    
+    # Text beyond the character budget is not kept
+    max_chars = tools._PDF_CACHE_MAX_CHARS
+    tools._PDF_CACHE_MAX_CHARS = len(full["content"]) - 1
+    try:
+        tools.read_pdf_content(test_file)
+        assert len(tools._PDF_CACHE) == 1
+    finally:
+        tools._PDF_CACHE_MAX_CHARS = max_chars
+    print("✅ Cache bounded by text size")
+    
+    # Failed extractions are not cached
+    with open(test_file, "w") as f:
+        f.write("not a pdf")
+    assert "error" in tools.read_pdf_content(test_file)
+    assert len(tools._PDF_CACHE) == 1
+    print("✅ Errors not cached")
+    
+    # Cleanup
+    os.remove(test_file)
+    print()
+
+
+async def test_response_cache():
+    """Test the on-disk LLM response cache."""
+    print("TEST 8: Response Cache")
+    print("-" * 60)
+    
+    import tempfile
+    from google.adk.agents import ResponseCache
+    
+    # Keys are stable, and part boundaries are part of the key
+    key = ResponseCache.make_key("model", "instruction", "prompt")
+    assert key == ResponseCache.make_key("model", "instruction", "prompt")
+    assert key != ResponseCache.make_key("model", "instruction", "prompt2")
+    assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+    print(f"✅ Cache key: {key[:16]}...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = ResponseCache(tmp_dir, ttl=60)
+        
+        # Miss, then hit; a second set replaces the entry without leftovers
+        assert cache.get(key) is None
+        cache.set(key, "first")
+        assert cache.get(key) == "first"
+        cache.set(key, "second")
+        assert cache.get(key) == "second"
+        assert os.listdir(tmp_dir) == [key]
+        print("✅ Get/set round trip")
+        
+        # Entries older than the TTL are misses and are deleted
+        entry = os.path.join(tmp_dir, key)
+        stale = os.stat(entry).st_mtime - 120
+        os.utime(entry, (stale, stale))
+        assert cache.get(key) is None
+        assert not os.path.exists(entry)
+        print("✅ Expired entry removed")
+        
+        # An unwritable cache directory is a miss, not an error
+        blocker = os.path.join(tmp_dir, "not_a_dir")
+        with open(blocker, "w") as f:
+            f.write("")
+        broken = ResponseCache(os.path.join(blocker, "cache"))
+        broken.set(key, "response")
+        assert broken.get(key) is None
+        
+        # A write that fails after the temp file is created leaves nothing behind
+        other_key = ResponseCache.make_key("other")
+        os.mkdir(os.path.join(tmp_dir, other_key))
+        cache.set(other_key, "response")
+        assert not [name for name in os.listdir(tmp_dir) if name.endswith(".tmp")]
+        print("✅ Failed cache write ignored")
+    print()
+
+
+async def test_taxonomist_prefilter():
+    """Test that verb-tagged questions reach the model with their levels filled in."""
+    print("TEST 9: Taxonomist Pre-classification")
+    print("-" * 60)
+    
+    import json
+    from profiler_agent.sub_agents.taxonomist import BloomPrefilterAgent
+    
+    class FakeModels:
+        def __init__(self):
+            self.prompts = []
+        
+        async def generate_content(self, model, contents, config):
+            prompt = contents[0].parts[0].text
+            self.prompts.append(prompt)
+            # Tag every question sent, disagreeing with any pre-filled level
+            questions, _ = json.JSONDecoder().raw_decode(prompt)
+            reply = json.dumps([
+                {
+                    "question": q["question"],
+                    "topic": "Optics" if "sky" in q["question"] else "Mechanics",
+                    "bloom_level": "Understand"
+                }
+                for q in questions
+            ])
+            return genai_types.GenerateContentResponse(candidates=[genai_types.Candidate(
+                content=genai_types.Content(role="model", parts=[genai_types.Part.from_text(text=reply)])
+            )])
+    
+    class FakeClient:
+        def __init__(self):
+            self.aio = type("Aio", (), {})()
+            self.aio.models = FakeModels()
+    
+    agent = BloomPrefilterAgent(name="taxonomist_test", model="test-model")
+    client = FakeClient()
+    await agent.initialize(client)
+    
+    # Known levels are sent pre-filled and kept; the model supplies topics
+    result = await agent.run("1. Define entropy.\n2. Why is the sky blue?", context={"exam": "physics"})
+    tagged = json.loads(result["response"])
+    sent = client.aio.models.prompts[-1]
+    assert '"bloom_level": "Remember"' in sent and '"bloom_level": null' in sent
+    assert "physics" in sent
+    assert tagged["model_classified"] == 1
+    assert tagged["questions"] == [
+        {"question": "1. Define entropy.", "topic": "Mechanics", "bloom_level": "Remember"},
+        {"question": "2. Why is the sky blue?", "topic": "Optics", "bloom_level": "Understand"}
+    ]
+    print("✅ Pre-filled levels kept, topics from the model")
+    
+    # A read_pdf_content result is unwrapped: headers and page markers are
+    # dropped and continuation lines stay with their question
+    pdf_result = json.dumps({
+        "filename": "physics.pdf",
+        "content": "\n--- Page 1 ---\nPhysics Midterm\n1. Define entropy.\n"
+                   "2. Why is the sky blue?\nRefer to scattering.\n"
+                   "\n--- Page 2 ---\n3. Calculate the force.",
+        "page_count": 2,
+        "file_path": "input/physics.pdf"
+    })
+    result = await agent.run(pdf_result)
+    tagged = json.loads(result["response"])
+    assert [q["question"] for q in tagged["questions"]] == [
+        "1. Define entropy.",
+        "2. Why is the sky blue? Refer to scattering.",
+        "3. Calculate the force."
+    ]
+    assert [q["bloom_level"] for q in tagged["questions"]] == ["Remember", "Understand", "Apply"]
+    assert tagged["model_classified"] == 1 and "model_response" not in tagged
+    print("✅ PDF tool result classified question by question")
+    print()
+
+
+async def test_svg_charts():
+    """Test the matplotlib-free SVG chart backend."""
+    print("TEST 10: SVG Charts")
+    print("-" * 60)
+    
+    import json
+    import tempfile
+    import xml.etree.ElementTree as ET
+    from profiler_agent import tools
+    
+    stats = json.dumps({
+        "topic_distribution": {"A & B": 3, "<C>": 1, "Optics": 2},
+        "bloom_distribution": {"Remember": 4, "Apply": 2}
+    })
+    svg_ns = "{http://www.w3.org/2000/svg}"
+    
+    # Start from an unloaded matplotlib so the SVG path is shown not to load it
+    saved_plt, tools._PLT = tools._PLT, None
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for chart_type in ("bar", "pie"):
+                result = tools.visualize_trends(
+                    stats, os.path.join(tmp_dir, f"{chart_type}.png"), chart_type, "svg"
+                )
+                assert result.get("success"), result
+                assert result["chart_path"].endswith(".svg")
+                
+                root = ET.parse(result["chart_path"]).getroot()
+                fills = [rect.get("fill") for rect in root.iter(f"{svg_ns}rect")]
+                topic_bars = 3 if chart_type == "bar" else 0
+                assert fills.count("skyblue") == topic_bars
+                assert fills.count("lightcoral") == 2
+                
+                labels = {text.text for text in root.iter(f"{svg_ns}text")}
+                assert {"A & B", "<C>"} <= labels
+                print(f"✅ {chart_type} chart written as valid SVG")
+            
+            assert tools._PLT is None
+            print("✅ Matplotlib not loaded")
+            
+            result = tools.visualize_trends(stats, os.path.join(tmp_dir, "chart.png"), "bar", "png")
+            assert "error" in result
+            print("✅ Unknown backend rejected")
+    finally:
+        if tools._PLT is None:
+            tools._PLT = saved_plt
+    print()
+
+
 async def main():
     """Run all tests."""
     print("\n" + "="*60)
@@ -224,6 +518,11 @@ async def main():
         await test_tools()
         await test_memory_bank()
         await test_runner_execution()
+        await test_runner_run_once()
+        await test_pdf_extraction_cache()
+        await test_response_cache()
+        await test_taxonomist_prefilter()
+        await test_svg_charts()
         
         print("="*60)
         print("✅ ALL TESTS PASSED")